@@ -1927,9 +1927,14 @@ def executeJSONRPC(jsonrpccommand):
 
     List of commands - <https://kodi.wiki/view/JSON-RPC_API/v9>
 
+    A JSON-RPC 2.0 batch (a JSON array of request objects) can be passed
+    as well. In this case the return string is a JSON array of responses.
+
     Example::
 
         response = xbmc.executeJSONRPC('{ "jsonrpc": "2.0", "method": "JSONRPC.Introspect", "id": 1 }')
+        responses = xbmc.executeJSONRPC('[{ "jsonrpc": "2.0", "method": "JSONRPC.Ping", "id": 1 }, '
+                                        '{ "jsonrpc": "2.0", "method": "JSONRPC.Version", "id": 2 }]')
     """
     return ""
 
@@ -2076,9 +2081,14 @@ def getInfoLabel(cLine):
 
     List of InfoTags -- <http://kodi.wiki/view/InfoLabels>
 
+    If the string is not a single InfoTag, it is parsed as a full label,
+    so ``$INFO[...]``, ``$LOCALIZE[...]`` and ``$ADDON[...]`` expressions
+    can be used as well.
+
     Example::
 
         label = xbmc.getInfoLabel('Weather.Conditions')
+        label = xbmc.getInfoLabel('$INFO[VideoPlayer.Title] ($INFO[VideoPlayer.Year])')
     """
     return ""
 
@@ -2230,6 +2240,23 @@ def translatePath(path):
     converts ``'special://masterprofile/script_data'`` ->
     ``'/home/user/XBMC/UserData/script_data'`` on Linux.
 
+    Commonly used special paths:
+
+    ========================= ==============================================
+    Path                      Description
+    ========================= ==============================================
+    special://xbmc            Kodi installation directory
+    special://home            Kodi user home directory
+    special://temp            Kodi temporary directory
+    special://masterprofile   Master profile directory (userdata)
+    special://profile         Current profile directory
+    special://userdata        Same as special://masterprofile
+    special://skin            Directory of the current skin
+    special://logpath         Directory of kodi.log
+    ========================= ==============================================
+
+    List of special protocol paths -- <https://kodi.wiki/view/Special_protocol>
+
     Example::
 
         fpath = xbmc.translatePath('special://masterprofile/script_data')
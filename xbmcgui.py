@@ -2672,6 +2672,15 @@ class ListItem(object):
     :param iconImage: **Deprecated. Use setArt**
     :param thumbnailImage: **Deprecated. Use setArt**
     :param path: [opt] string
+    :param offscreen: [opt] bool (default False) - if GUI based locks should be
+        avoided. Most of the times listitems are created offscreen and added
+        later to a container for display (e.g. plugins) or they are not even
+        displayed (e.g. python scrapers). In such cases, there is no need to
+        lock the GUI when creating the items (increasing your addon
+        performance). Note however, that if you are creating listitems and
+        managing the container itself (e.g using WindowXML or WindowXMLDialog
+        classes) subsequent modifications to the item will require locking.
+        Thus, in such cases, use the default value (False).
 
     .. warning::
         **iconImage** and **thumbnailImage** are deprecated.
@@ -2680,6 +2689,7 @@ class ListItem(object):
     Example::
 
         listitem = xbmcgui.ListItem('Casino Royale')
+        listitem = xbmcgui.ListItem('Casino Royale', offscreen=True)
     """
     
     def __init__(self, label="", label2="", iconImage="", thumbnailImage="",